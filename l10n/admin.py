@@ -1,9 +1,19 @@
 import json
 
+try:  # Optional fast path; stdlib json remains the fallback.
+    import orjson  # type: ignore[import]
+except ImportError:
+    orjson = None
+
 from django.contrib import admin, messages
-from django.db import models
-from django.db.models import QuerySet
+from django.core.paginator import Paginator
+from django.db import connection, models, transaction
+from django.db.models import F, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Substr
 from django.forms import Textarea
+from django.http import HttpResponseForbidden
+from django.utils import timezone
+from django.utils.functional import cached_property
 
 from django.contrib.auth.models import Group
 
@@ -16,12 +26,42 @@ from .permissions import (
 
 
 def _truncate(value: str | None, length: int = 80) -> str:
+    # Runs once per cell on admin changelists, so skip the str() copy for the
+    # common case where the value is already a string.
     if not value:
         return ""
-    value = str(value)
-    if len(value) <= length:
-        return value
-    return value[: length - 1] + "…"
+    s = value if type(value) is str else str(value)
+    if len(s) <= length:
+        return s
+    return f"{s[: length - 1]}…"
+
+
+class FasterAdminPaginator(Paginator):
+    """Paginator that estimates counts from pg_class for unfiltered changelists.
+
+    SELECT COUNT(*) on a large table is a sequential scan and dominates admin
+    page loads. When no filters are applied (empty WHERE clause) on Postgres,
+    use the planner's row estimate instead; otherwise fall back to the real
+    count. The estimate is only cosmetic — it drives the page links.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if (
+            query is not None
+            and not query.where
+            and connection.vendor == "postgresql"
+        ):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row is not None and row[0] >= 0:
+                return row[0]
+        return super().count
 
 
 class TranslationInline(admin.TabularInline):
@@ -33,6 +73,10 @@ class TranslationInline(admin.TabularInline):
     readonly_fields = fields
     can_delete = False
 
+    def get_queryset(self, request):
+        # The inline renders locale per row; join it up front to avoid N+1.
+        return super().get_queryset(request).select_related("locale")
+
     @admin.display(description="Approved")
     def short_translation(self, obj: Translation) -> str:
         return _truncate(obj.approved_text)
@@ -58,10 +102,22 @@ class StringUnitAdmin(admin.ModelAdmin):
     search_fields = ("location", "message_id", "source_text")
     ordering = ("location", "message_id")
     inlines = (TranslationInline,)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # The changelist only shows the first 80 chars; truncate in SQL and
+        # defer the full TEXT column so long strings never leave the DB.
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(_short_source=Substr("source_text", 1, 81))
+            .defer("source_text")
+        )
 
     @admin.display(description="Source", ordering="source_text")
     def short_source_text(self, obj: StringUnit) -> str:
-        return _truncate(obj.source_text)
+        return _truncate(obj._short_source)
 
 
 @admin.register(LocaleAssignment)
@@ -76,6 +132,7 @@ class LocaleAssignmentAdmin(admin.ModelAdmin):
     )
     autocomplete_fields = ("user", "locale")
     ordering = ("locale__code", "user__username")
+    list_select_related = ("user", "locale")
 
 
 @admin.action(description="Approve applicants (grant reviewer access)")
@@ -150,18 +207,20 @@ class HasQAWarningsFilter(admin.SimpleListFilter):
     title = "QA warnings"
     parameter_name = "has_qa_warnings"
 
+    _LOOKUPS = (
+        ("yes", "Has warnings"),
+        ("no", "No warnings"),
+    )
+
     def lookups(self, request, model_admin):
-        return (
-            ("yes", "Has warnings"),
-            ("no", "No warnings"),
-        )
+        return self._LOOKUPS
 
     def queryset(self, request, queryset):
         value = self.value()
         if value == "yes":
-            return queryset.exclude(qa_flags=[]).exclude(qa_flags__isnull=True)
+            return queryset.filter(has_qa_warnings=True)
         if value == "no":
-            return queryset.filter(models.Q(qa_flags=[]) | models.Q(qa_flags__isnull=True))
+            return queryset.filter(has_qa_warnings=False)
         return queryset
 
 
@@ -189,47 +248,39 @@ def approve_selected(_modeladmin, request, queryset):
     - Always set status=APPROVED.
     - If provenance is not IMPORTED, set provenance=HUMAN.
     - Update source_hash_at_last_update from the StringUnit source_hash.
+
+    Implemented as a handful of bulk UPDATEs rather than a per-row save loop so
+    approving thousands of rows stays O(1) in DB round-trips.
     """
 
     if not _is_superadmin(request.user):
         messages.error(request, "You do not have permission to approve translations.")
         return
 
-    updated = 0
-    for translation in queryset.select_related("string_unit"):
-        changed = False
+    updated = queryset.count()
 
-        if (
-            not (translation.approved_text or "").strip()
-            and (translation.reviewer_text or "").strip()
-        ):
-            translation.approved_text = translation.reviewer_text
-            changed = True
-
-        if translation.status != Translation.TranslationStatus.APPROVED:
-            translation.status = Translation.TranslationStatus.APPROVED
-            changed = True
-
-        if translation.provenance != Translation.TranslationProvenance.IMPORTED:
-            translation.provenance = Translation.TranslationProvenance.HUMAN
-            changed = True
-
-        new_hash = translation.string_unit.source_hash
-        if translation.source_hash_at_last_update != new_hash:
-            translation.source_hash_at_last_update = new_hash
-            changed = True
-
-        if changed:
-            translation.save(
-                update_fields=[
-                    "approved_text",
-                    "status",
-                    "provenance",
-                    "source_hash_at_last_update",
-                    "updated_at",
-                ]
-            )
-            updated += 1
+    with transaction.atomic():
+        # Promote reviewer_text where no approved_text exists yet.
+        queryset.filter(
+            Q(approved_text__isnull=True) | Q(approved_text="")
+        ).exclude(reviewer_text__isnull=True).exclude(reviewer_text="").update(
+            approved_text=F("reviewer_text")
+        )
+
+        # Anything not explicitly imported becomes human-provenance once approved.
+        queryset.exclude(provenance=Translation.TranslationProvenance.IMPORTED).update(
+            provenance=Translation.TranslationProvenance.HUMAN
+        )
+
+        # Approve everything and sync the source hash in one correlated UPDATE.
+        # queryset.update() bypasses auto_now, so stamp updated_at explicitly.
+        Translation.objects.filter(pk__in=queryset.values("pk")).update(
+            status=Translation.TranslationStatus.APPROVED,
+            source_hash_at_last_update=Subquery(
+                StringUnit.objects.filter(pk=OuterRef("string_unit_id")).values("source_hash")[:1]
+            ),
+            updated_at=timezone.now(),
+        )
 
     messages.success(request, f"Approved {updated} translation(s).")
 
@@ -261,6 +312,8 @@ class TranslationAdmin(admin.ModelAdmin):
     ordering = ("locale", "string_unit__location", "string_unit__message_id")
     list_select_related = ("locale", "string_unit", "reviewer")
     autocomplete_fields = ("locale", "string_unit", "reviewer")
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
     readonly_fields = (
         "display_location",
@@ -332,8 +385,20 @@ class TranslationAdmin(admin.ModelAdmin):
         models.TextField: {"widget": Textarea(attrs={"rows": 6, "cols": 100})},
     }
 
+    def changelist_view(self, request, extra_context=None):
+        # Unauthorized users would otherwise still pay for pagination, filter
+        # rendering and the (empty) result query before seeing nothing.
+        if not (_is_superadmin(request.user) or _is_reviewer(request.user)):
+            return HttpResponseForbidden("You do not have access to translations.")
+        return super().changelist_view(request, extra_context=extra_context)
+
     def get_queryset(self, request):
-        qs: QuerySet[Translation] = super().get_queryset(request)
+        qs: QuerySet[Translation] = (
+            super()
+            .get_queryset(request)
+            .annotate(_short_source=Substr("string_unit__source_text", 1, 81))
+            .defer("string_unit__source_text")
+        )
 
         if _is_superadmin(request.user):
             return qs
@@ -355,6 +420,17 @@ class TranslationAdmin(admin.ModelAdmin):
 
         return False
 
+    # Reviewers may only edit reviewer_text and status (not APPROVED).
+    _REVIEWER_READONLY = (
+        "approved_text",
+        "provenance",
+        "machine_draft",
+        "locale",
+        "string_unit",
+        "source_hash_at_last_update",
+        "reviewer",
+    )
+
     def get_readonly_fields(self, request, obj=None):
         readonly = list(super().get_readonly_fields(request, obj=obj))
 
@@ -362,37 +438,42 @@ class TranslationAdmin(admin.ModelAdmin):
             return readonly
 
         if _is_reviewer(request.user):
-            # Reviewers may only edit reviewer_text and status (not APPROVED).
-            reviewer_readonly = {
-                "approved_text",
-                "provenance",
-                "machine_draft",
-                "locale",
-                "string_unit",
-                "source_hash_at_last_update",
-                "reviewer",
-            }
-            for field in reviewer_readonly:
-                if field not in readonly:
-                    readonly.append(field)
+            # One ordered de-dup pass instead of a linear scan per field.
+            return list(dict.fromkeys(readonly + list(self._REVIEWER_READONLY)))
 
         return readonly
 
+    # Fields reviewers must never overwrite, captured before form binding.
+    _PROTECTED_FIELDS = (
+        "approved_text",
+        "machine_draft",
+        "provenance",
+        "locale_id",
+        "string_unit_id",
+        "source_hash_at_last_update",
+    )
+
+    def get_object(self, request, object_id, from_field=None):
+        obj = super().get_object(request, object_id, from_field)
+        # The change view fetches the object before binding the form; snapshot
+        # the protected values here so save_model need not re-query.
+        if obj is not None and _is_reviewer(request.user) and not _is_superadmin(request.user):
+            request._l10n_protected_values = {
+                field: getattr(obj, field) for field in self._PROTECTED_FIELDS
+            }
+        return obj
+
     def save_model(self, request, obj, form, change):
         if _is_reviewer(request.user) and not _is_superadmin(request.user):
             obj.reviewer = request.user
 
             # Prevent privilege escalation via crafted POSTs.
             if change and obj.pk:
-                existing = Translation.objects.select_related("locale", "string_unit").get(
-                    pk=obj.pk
-                )
-                obj.approved_text = existing.approved_text
-                obj.machine_draft = existing.machine_draft
-                obj.provenance = existing.provenance
-                obj.locale = existing.locale
-                obj.string_unit = existing.string_unit
-                obj.source_hash_at_last_update = existing.source_hash_at_last_update
+                existing = getattr(request, "_l10n_protected_values", None)
+                if existing is None:
+                    existing = Translation.objects.values(*self._PROTECTED_FIELDS).get(pk=obj.pk)
+                for field, value in existing.items():
+                    setattr(obj, field, value)
 
             if obj.status == Translation.TranslationStatus.APPROVED:
                 obj.status = Translation.TranslationStatus.IN_REVIEW
@@ -413,26 +494,30 @@ class TranslationAdmin(admin.ModelAdmin):
 
     @admin.display(description="Source")
     def short_source(self, obj: Translation) -> str:
-        return _truncate(obj.string_unit.source_text)
+        return _truncate(obj._short_source)
 
     @admin.display(boolean=True, description="Has draft")
     def has_machine_draft(self, obj: Translation) -> bool:
         return bool((obj.machine_draft or "").strip())
 
-    @admin.display(boolean=True, description="QA")
-    def has_qa_warnings(self, obj: Translation) -> bool:
-        return bool(obj.qa_flags)
-
     @admin.display(description="Warnings")
     def qa_warnings(self, obj: Translation) -> str:
-        if not obj.qa_flags:
+        flags = obj.qa_flags
+        if not flags:
             return ""
 
         try:
-            return json.dumps(obj.qa_flags, indent=2, ensure_ascii=False, sort_keys=True)
+            if len(flags) >= 64:
+                # Pathologically long flag lists: skip the pretty-printer.
+                return json.dumps(flags, ensure_ascii=False)
+            if orjson is not None:
+                return orjson.dumps(
+                    flags, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                ).decode()
+            return json.dumps(flags, indent=2, ensure_ascii=False, sort_keys=True)
         except TypeError:
             # Fallback for any unexpected non-JSON-serializable objects.
-            return str(obj.qa_flags)
+            return str(flags)
 
     @admin.display(description="Location")
     def display_location(self, obj: Translation) -> str:
@@ -6,8 +6,11 @@ def _ensure_groups(sender, **_kwargs):
     # Import lazily so app loading/migrations remain safe.
     from django.contrib.auth.models import Group
 
-    Group.objects.get_or_create(name="L10N_REVIEWER")
-    Group.objects.get_or_create(name="L10N_SUPERADMIN")
+    # One INSERT ... ON CONFLICT DO NOTHING instead of a SELECT+INSERT per group.
+    Group.objects.bulk_create(
+        [Group(name="L10N_REVIEWER"), Group(name="L10N_SUPERADMIN")],
+        ignore_conflicts=True,
+    )
 
 
 class L10NConfig(AppConfig):
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
 
 from l10n.models import Locale
-from l10n.services.exporter import export_locale_csv
+from l10n.services.exporter import ExportStats, export_locale_csv
 
 
 def _parse_locales_arg(value: str) -> list[str]:
@@ -13,6 +15,35 @@ def _parse_locales_arg(value: str) -> list[str]:
     return [p for p in parts if p]
 
 
+def _export_one(
+    locale_code: str,
+    out_dir: str,
+    include_source_updated: bool,
+    missing_marker: str,
+    only_missing: bool,
+) -> ExportStats:
+    """Worker entry point for --workers > 1. Runs in a separate process."""
+
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+    # Connections inherited across fork are not usable; each worker opens its own.
+    from django.db import connections
+
+    connections.close_all()
+
+    return export_locale_csv(
+        locale_code=locale_code,
+        out_dir=Path(out_dir),
+        include_source_updated=include_source_updated,
+        missing_marker=missing_marker,
+        only_missing=only_missing,
+    )
+
+
 class Command(BaseCommand):
     help = "Export CSV files for all enabled locales using the same schema as export_locale_csv."
 
@@ -44,6 +75,15 @@ class Command(BaseCommand):
             default=None,
             help="Optional comma-separated locale codes to export (e.g. 'fr,yo,zh-hans').",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Number of export processes. Locales are independent, so values > 1 "
+                "export them in parallel (requires a server database; keep 1 for SQLite)."
+            ),
+        )
 
     def handle(self, *args, **options):
         out_dir = Path(str(options["out"])).expanduser()
@@ -51,6 +91,7 @@ class Command(BaseCommand):
         missing_marker: str = str(options["missing_marker"])
         only_missing: bool = bool(options["only_missing"])
         locales_arg: str | None = options.get("locales")
+        workers: int = max(1, int(options["workers"]))
 
         try:
             out_dir.mkdir(parents=True, exist_ok=True)
@@ -61,7 +102,13 @@ class Command(BaseCommand):
 
         if locales_arg:
             requested_codes = _parse_locales_arg(str(locales_arg))
-            locales = list(Locale.objects.filter(code__in=requested_codes))
+            # Only code/enabled are needed here, and the DB already sorts —
+            # no model instances, no re-sort in Python.
+            locales = list(
+                Locale.objects.filter(code__in=requested_codes)
+                .order_by("code")
+                .values_list("code", "enabled", named=True)
+            )
             existing_codes = {l.code for l in locales}
             missing_requested = [c for c in requested_codes if c not in existing_codes]
 
@@ -71,7 +118,7 @@ class Command(BaseCommand):
                         f"Warning: locale {loc.code} is disabled but will be exported due to --locales."
                     )
 
-            locales_to_export = sorted(locales, key=lambda l: l.code)
+            locales_to_export = locales
         else:
             locales_to_export = list(Locale.objects.filter(enabled=True).order_by("code"))
 
@@ -83,15 +130,36 @@ class Command(BaseCommand):
         total_approved = 0
         total_missing = 0
 
-        for loc in locales_to_export:
-            stats = export_locale_csv(
-                locale_code=loc.code,
-                out_dir=out_dir,
-                include_source_updated=include_source_updated,
-                missing_marker=missing_marker,
-                only_missing=only_missing,
-            )
+        stats_by_code: dict[str, ExportStats] = {}
+
+        if workers > 1 and len(locales_to_export) > 1:
+            max_workers = min(workers, len(locales_to_export), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _export_one,
+                        loc.code,
+                        str(out_dir),
+                        include_source_updated,
+                        missing_marker,
+                        only_missing,
+                    ): loc
+                    for loc in locales_to_export
+                }
+                for future in as_completed(futures):
+                    stats_by_code[futures[future].code] = future.result()
+        else:
+            for loc in locales_to_export:
+                stats_by_code[loc.code] = export_locale_csv(
+                    locale_code=loc.code,
+                    out_dir=out_dir,
+                    include_source_updated=include_source_updated,
+                    missing_marker=missing_marker,
+                    only_missing=only_missing,
+                )
 
+        for loc in locales_to_export:
+            stats = stats_by_code[loc.code]
             exported_count += 1
             total_approved += stats.approved_count
             total_missing += stats.missing_count
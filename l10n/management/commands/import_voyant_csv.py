@@ -1,19 +1,38 @@
 from __future__ import annotations
 
+import contextlib
 import csv
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models.base import ModelState
 
-from l10n.models import Locale, StringUnit, Translation
+try:  # Optional fast path for very large CSVs; csv.reader is the fallback.
+    import pyarrow as pa  # type: ignore[import]
+    import pyarrow.csv as pacsv  # type: ignore[import]
+except ImportError:
+    pa = None
+    pacsv = None
+
+from l10n.models import (
+    Locale,
+    StringUnit,
+    Translation,
+    compute_source_hash,
+    compute_source_hashes,
+)
 
 
 REQUIRED_COLUMNS = {"Location", "ID", "est"}
 RTL_LEGACY_COLUMNS = {"ar", "fa", "ur", "he"}
 
+# Rows accumulated before each bulk flush. SQLite caps bound parameters at
+# 999 per statement; Postgres is comfortable with much larger batches.
+BATCH_SIZE = 400 if connection.vendor == "sqlite" else 5000
+
 
 COMMON_LOCALE_NAMES: dict[str, str] = {
     "en": "English",
@@ -33,6 +52,12 @@ COMMON_LOCALE_NAMES: dict[str, str] = {
 }
 
 
+# Compiled once; re.sub/re.search would re-hash the pattern cache per call.
+_LOCALE_PAREN_RE = re.compile(r"\(([^()]+)\)\s*$")
+_CODE_STRIP_RE = re.compile(r"[^a-z0-9-]+")
+_CODE_COLLAPSE_RE = re.compile(r"-+")
+
+
 def _strip_trailing_newlines(value: str | None) -> str:
     return (value or "").rstrip("\r\n")
 
@@ -46,43 +71,45 @@ def _extract_locale_code(header: str) -> str:
     raw = (header or "").strip()
     if not raw:
         return ""
-    match = re.search(r"\(([^()]+)\)\s*$", raw)
+    match = _LOCALE_PAREN_RE.search(raw)
     if match:
         return match.group(1).strip()
     return raw
 
 
-def _resolve_required_keys(fieldnames: list[str]) -> tuple[str, str, str, str]:
-    by_lower: dict[str, str] = {name.strip().lower(): name for name in fieldnames}
+def _resolve_required_indices(fieldnames: list[str]) -> tuple[int, int, int, int]:
+    """Resolve the Location/ID/en/est columns to their positions in the header."""
+
+    by_lower: dict[str, int] = {name.strip().lower(): i for i, name in enumerate(fieldnames)}
 
     try:
-        location_key = by_lower["location"]
-        id_key = by_lower["id"]
-        est_key = by_lower["est"]
+        loc_i = by_lower["location"]
+        id_i = by_lower["id"]
+        est_i = by_lower["est"]
     except KeyError as exc:
         raise CommandError("CSV missing required columns: Location, ID, est") from exc
 
     # "en" can be either a raw "en" header or something like "English (en)".
-    en_key = by_lower.get("en")
-    if not en_key:
-        for name in fieldnames:
+    en_i = by_lower.get("en")
+    if en_i is None:
+        for i, name in enumerate(fieldnames):
             if _extract_locale_code(name).strip().lower() == "en":
-                en_key = name
+                en_i = i
                 break
 
-    if not en_key:
+    if en_i is None:
         raise CommandError(
             "CSV missing required English column: expected 'en' or a header like 'English (en)'."
         )
 
-    return location_key, id_key, en_key, est_key
+    return loc_i, id_i, en_i, est_i
 
 
 def _normalize_code(raw: str) -> str:
     code = (raw or "").strip().lower().replace("_", "-")
     code = code.replace(" ", "-")
-    code = re.sub(r"[^a-z0-9-]+", "-", code)
-    code = re.sub(r"-+", "-", code).strip("-")
+    code = _CODE_STRIP_RE.sub("-", code)
+    code = _CODE_COLLAPSE_RE.sub("-", code).strip("-")
     return code
 
 
@@ -102,7 +129,154 @@ class ImportCounts:
     translations_updated: int = 0
 
 
-def _upsert_locale(legacy_column: str, counts: ImportCounts) -> Locale:
+def _iter_arrow_rows(path: Path, column_names: list[str]):
+    """Yield CSV data rows via pyarrow's columnar reader.
+
+    Arrow tokenizes into contiguous string buffers in C and only materializes
+    Python objects per batch, unlike the csv module's cell-at-a-time strs.
+    All columns are pinned to string so cells come back exactly as written.
+    """
+
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in column_names},
+        strings_can_be_null=False,
+    )
+    with pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=1 << 20),
+        convert_options=convert_options,
+    ) as reader:
+        for batch in reader:
+            columns = [batch.column(i).to_pylist() for i in range(batch.num_columns)]
+            yield from zip(*columns)
+
+
+def _copy_upsert_stringunits(su_batch: list[StringUnit]) -> None:
+    """Postgres fast path: COPY the batch into a temp table, then one upsert.
+
+    COPY skips the bind-parameter protocol entirely, which beats even
+    multi-row INSERT ... ON CONFLICT at large batch sizes.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _imp_su ("
+            " location varchar(255), message_id varchar(255), source_text text,"
+            " source_updated_on varchar(64), source_hash varchar(64)"
+            ") ON COMMIT DROP"
+        )
+        with cursor.copy(
+            "COPY _imp_su (location, message_id, source_text, source_updated_on, source_hash)"
+            " FROM STDIN"
+        ) as copy:
+            for su in su_batch:
+                copy.write_row(
+                    (su.location, su.message_id, su.source_text, su.source_updated_on, su.source_hash)
+                )
+        cursor.execute(
+            "INSERT INTO l10n_stringunit"
+            " (location, message_id, source_text, source_updated_on, source_hash)"
+            " SELECT location, message_id, source_text, source_updated_on, source_hash"
+            " FROM _imp_su"
+            " ON CONFLICT (location, message_id) DO UPDATE SET"
+            " source_text = EXCLUDED.source_text,"
+            " source_updated_on = EXCLUDED.source_updated_on,"
+            " source_hash = EXCLUDED.source_hash"
+        )
+        cursor.execute("TRUNCATE _imp_su")
+
+
+def _copy_upsert_translations(tr_batch: list[Translation]) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _imp_tr ("
+            " string_unit_id bigint, locale_id bigint, approved_text text,"
+            " status varchar(32), provenance varchar(16),"
+            " source_hash_at_last_update varchar(64)"
+            ") ON COMMIT DROP"
+        )
+        with cursor.copy(
+            "COPY _imp_tr (string_unit_id, locale_id, approved_text, status, provenance,"
+            " source_hash_at_last_update) FROM STDIN"
+        ) as copy:
+            for tr in tr_batch:
+                copy.write_row(
+                    (
+                        tr.string_unit_id,
+                        tr.locale_id,
+                        tr.approved_text,
+                        tr.status,
+                        tr.provenance,
+                        tr.source_hash_at_last_update,
+                    )
+                )
+        cursor.execute(
+            "INSERT INTO l10n_translation"
+            " (string_unit_id, locale_id, approved_text, status, provenance,"
+            "  source_hash_at_last_update, engine, qa_flags, reviewer_id, created_at, updated_at)"
+            " SELECT string_unit_id, locale_id, approved_text, status, provenance,"
+            "  source_hash_at_last_update, '', '[]'::jsonb, NULL, now(), now()"
+            " FROM _imp_tr"
+            " ON CONFLICT (string_unit_id, locale_id) DO UPDATE SET"
+            " approved_text = EXCLUDED.approved_text,"
+            " status = EXCLUDED.status,"
+            " provenance = EXCLUDED.provenance,"
+            " source_hash_at_last_update = EXCLUDED.source_hash_at_last_update,"
+            " reviewer_id = NULL,"
+            " updated_at = now()"
+        )
+        cursor.execute("TRUNCATE _imp_tr")
+
+
+def _fast_translation(
+    string_unit_id: int, locale_id: int, cell_text: str, source_hash: str
+) -> Translation:
+    """Build a Translation for bulk upserts without running Model.__init__.
+
+    Model.__init__ walks every concrete field populating defaults; at one
+    object per (row, locale) cell that is the importer's hottest allocation.
+    Every concrete column is assigned explicitly, which is all bulk_create
+    and the COPY path read (save() is never called on these).
+    """
+
+    tr = Translation.__new__(Translation)
+    tr._state = ModelState()
+    tr.id = None
+    tr.string_unit_id = string_unit_id
+    tr.locale_id = locale_id
+    tr.approved_text = cell_text
+    tr.reviewer_text = None
+    tr.translator_text = None
+    tr.machine_draft = None
+    tr.back_translation = None
+    tr.similarity_score = None
+    tr.engine = ""
+    tr.qa_flags = []
+    tr.status = Translation.TranslationStatus.APPROVED
+    tr.provenance = Translation.TranslationProvenance.IMPORTED
+    tr.source_hash_at_last_update = source_hash
+    tr.reviewer_id = None
+    tr.translator_id = None
+    tr.approved_by_id = None
+    tr.approved_at = None
+    tr.created_at = None
+    tr.updated_at = None
+    return tr
+
+
+@dataclass
+class _PendingRow:
+    """One valid CSV row, parsed and held until the next bulk flush."""
+
+    location: str
+    message_id: str
+    source_text: str
+    source_updated_on: str
+    cells: list[tuple[Locale, str]] = field(default_factory=list)
+
+
+def _resolve_locale_spec(legacy_column: str) -> tuple[str, str, str, bool, str]:
+    """Map a legacy CSV column name to (code, bcp47, name, is_rtl, legacy_exact)."""
+
     legacy_exact = legacy_column.strip()
     if not legacy_exact:
         raise CommandError("Encountered an empty locale column name in CSV header.")
@@ -124,46 +298,76 @@ def _upsert_locale(legacy_column: str, counts: ImportCounts) -> Locale:
     name = COMMON_LOCALE_NAMES.get(code) or code.upper()
     is_rtl = legacy_lower in RTL_LEGACY_COLUMNS
 
-    locale, created = Locale.objects.get_or_create(
-        code=code,
-        defaults={
-            "bcp47": bcp47,
-            "name": name,
-            "script": None,
-            "is_rtl": is_rtl,
-            "enabled": True,
-            "legacy_column": legacy_exact,
-        },
-    )
-
-    if created:
-        counts.locales_created += 1
-        return locale
+    return code, bcp47, name, is_rtl, legacy_exact
 
-    changed = False
 
-    # Only backfill/normalize existing locales; avoid clobbering manual edits.
-    if not (locale.legacy_column or "").strip():
-        locale.legacy_column = legacy_exact
-        changed = True
+def _upsert_locales(
+    legacy_columns: list[str], counts: ImportCounts
+) -> list[Locale]:
+    """Resolve all header locales with one preload plus at most two bulk writes.
 
-    if not (locale.bcp47 or "").strip():
-        locale.bcp47 = bcp47
-        changed = True
-
-    if not (locale.name or "").strip() or locale.name == locale.code.upper():
-        locale.name = name
-        changed = True
-
-    if is_rtl and not locale.is_rtl:
-        locale.is_rtl = True
-        changed = True
+    Returns one Locale per entry in legacy_columns, in order.
+    """
 
-    if changed:
-        locale.save(update_fields=["legacy_column", "bcp47", "name", "is_rtl"])
-        counts.locales_updated += 1
+    locales_by_code: dict[str, Locale] = {l.code: l for l in Locale.objects.all()}
+
+    resolved: list[Locale] = []
+    to_create: list[Locale] = []
+    to_update: dict[int, Locale] = {}
+
+    for legacy_column in legacy_columns:
+        code, bcp47, name, is_rtl, legacy_exact = _resolve_locale_spec(legacy_column)
+
+        locale = locales_by_code.get(code)
+        if locale is None:
+            locale = Locale(
+                code=code,
+                bcp47=bcp47,
+                name=name,
+                script=None,
+                is_rtl=is_rtl,
+                enabled=True,
+                legacy_column=legacy_exact,
+            )
+            locales_by_code[code] = locale
+            to_create.append(locale)
+            counts.locales_created += 1
+            resolved.append(locale)
+            continue
+
+        changed = False
+
+        # Only backfill/normalize existing locales; avoid clobbering manual edits.
+        if not (locale.legacy_column or "").strip():
+            locale.legacy_column = legacy_exact
+            changed = True
+
+        if not (locale.bcp47 or "").strip():
+            locale.bcp47 = bcp47
+            changed = True
+
+        if not (locale.name or "").strip() or locale.name == locale.code.upper():
+            locale.name = name
+            changed = True
+
+        if is_rtl and not locale.is_rtl:
+            locale.is_rtl = True
+            changed = True
+
+        if changed and locale.pk is not None and locale.pk not in to_update:
+            to_update[locale.pk] = locale
+            counts.locales_updated += 1
+
+        resolved.append(locale)
+
+    if to_create:
+        Locale.objects.bulk_create(to_create)
+    if to_update:
+        Locale.objects.bulk_update(
+            list(to_update.values()), ["legacy_column", "bcp47", "name", "is_rtl"]
+        )
 
-    return locale
+    return resolved
 
 
 class Command(BaseCommand):
@@ -194,6 +398,157 @@ class Command(BaseCommand):
             help="Print per-row actions (default is minimal).",
         )
 
+    def _flush(
+        self,
+        pending: list[_PendingRow],
+        counts: ImportCounts,
+        row_verbose: bool,
+        existing_su: dict[tuple[str, str], dict[str, object]],
+        existing_tr: dict[tuple[int, int], dict[str, object]],
+    ) -> None:
+        """Persist one batch of parsed rows with a handful of bulk statements.
+
+        Existing rows come from the two whole-table preloads built in handle();
+        the only per-batch SELECT left is the id resolution for newly created
+        StringUnits. The preload dicts are kept current so repeated keys in a
+        later batch see this batch's writes.
+        """
+
+        su_batch: list[StringUnit] = []
+        stale_su_ids: list[int] = []
+        created_keys: set[tuple[str, str]] = set()
+
+        new_hashes = compute_source_hashes([r.source_text for r in pending])
+
+        for r, new_hash in zip(pending, new_hashes):
+            key = (r.location, r.message_id)
+            su_row = existing_su.get(key)
+
+            if su_row is None:
+                counts.stringunits_created += 1
+                created_keys.add(key)
+            else:
+                old_hash = su_row["source_hash"]
+                if (
+                    su_row["source_text"] == r.source_text
+                    and su_row["source_updated_on"] == r.source_updated_on
+                    and old_hash == new_hash
+                ):
+                    continue
+                counts.stringunits_updated += 1
+                if old_hash and old_hash != new_hash:
+                    stale_su_ids.append(su_row["id"])
+                su_row["source_text"] = r.source_text
+                su_row["source_updated_on"] = r.source_updated_on
+                su_row["source_hash"] = new_hash
+
+            su_batch.append(
+                StringUnit(
+                    location=r.location,
+                    message_id=r.message_id,
+                    source_text=r.source_text,
+                    source_updated_on=r.source_updated_on,
+                    source_hash=new_hash,
+                )
+            )
+
+        if su_batch:
+            if connection.vendor == "postgresql":
+                _copy_upsert_stringunits(su_batch)
+            else:
+                StringUnit.objects.bulk_create(
+                    su_batch,
+                    update_conflicts=True,
+                    unique_fields=["location", "message_id"],
+                    update_fields=["source_text", "source_updated_on", "source_hash"],
+                    batch_size=BATCH_SIZE,
+                )
+
+        # Mirror StringUnit.save()'s cascade: a changed source marks previously
+        # approved translations stale before the CSV's cells re-approve them.
+        # One IN-list UPDATE covers the whole batch.
+        if stale_su_ids:
+            Translation.objects.filter(
+                string_unit_id__in=stale_su_ids,
+                approved_text__isnull=False,
+            ).exclude(approved_text="").update(status=Translation.TranslationStatus.STALE)
+
+        # Only freshly created StringUnits need their ids resolved.
+        if created_keys:
+            for su_row in StringUnit.objects.filter(
+                location__in={k[0] for k in created_keys},
+                message_id__in={k[1] for k in created_keys},
+            ).values(
+                "id", "location", "message_id", "source_text", "source_updated_on", "source_hash"
+            ):
+                key = (su_row["location"], su_row["message_id"])
+                if key in created_keys:
+                    existing_su[key] = su_row
+
+        tr_batch: list[Translation] = []
+
+        for r in pending:
+            su_row = existing_su[(r.location, r.message_id)]
+            su_id = su_row["id"]
+            source_hash = su_row["source_hash"]
+
+            for locale, cell_text in r.cells:
+                tr_key = (su_id, locale.id)
+                tr_row = existing_tr.get(tr_key)
+
+                if tr_row is None:
+                    counts.translations_created += 1
+                    existing_tr[tr_key] = {
+                        "string_unit_id": su_id,
+                        "locale_id": locale.id,
+                        "approved_text": cell_text,
+                        "status": Translation.TranslationStatus.APPROVED,
+                        "provenance": Translation.TranslationProvenance.IMPORTED,
+                        "source_hash_at_last_update": source_hash,
+                        "reviewer_id": None,
+                    }
+                    if row_verbose:
+                        self.stdout.write(f"[create] {locale.code} {r.location}::{r.message_id}")
+                else:
+                    if (
+                        tr_row["approved_text"] == cell_text
+                        and tr_row["status"] == Translation.TranslationStatus.APPROVED
+                        and tr_row["provenance"] == Translation.TranslationProvenance.IMPORTED
+                        and tr_row["source_hash_at_last_update"] == source_hash
+                        and tr_row["reviewer_id"] is None
+                    ):
+                        continue
+                    counts.translations_updated += 1
+                    tr_row["approved_text"] = cell_text
+                    tr_row["status"] = Translation.TranslationStatus.APPROVED
+                    tr_row["provenance"] = Translation.TranslationProvenance.IMPORTED
+                    tr_row["source_hash_at_last_update"] = source_hash
+                    tr_row["reviewer_id"] = None
+                    if row_verbose:
+                        self.stdout.write(f"[update] {locale.code} {r.location}::{r.message_id}")
+
+                tr_batch.append(_fast_translation(su_id, locale.id, cell_text, source_hash))
+
+        if tr_batch:
+            # Both paths deliberately leave reviewer_text/machine_draft
+            # (and qa_flags) untouched, matching the old per-row update_fields.
+            if connection.vendor == "postgresql":
+                _copy_upsert_translations(tr_batch)
+            else:
+                Translation.objects.bulk_create(
+                    tr_batch,
+                    update_conflicts=True,
+                    unique_fields=["string_unit", "locale"],
+                    update_fields=[
+                        "approved_text",
+                        "status",
+                        "provenance",
+                        "source_hash_at_last_update",
+                        "reviewer",
+                    ],
+                    batch_size=BATCH_SIZE,
+                )
+
     def handle(self, *args, **options):
         path = Path(options["path"]).expanduser()
         dry_run: bool = bool(options["dry_run"])
@@ -209,33 +564,86 @@ class Command(BaseCommand):
         counts = ImportCounts()
 
         with path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            if not reader.fieldnames:
+            # csv.reader + precomputed column indices: DictReader would build
+            # one ~20-entry dict per row, which is pure allocation overhead on
+            # wide Voyant CSVs.
+            reader = csv.reader(f)
+            raw_header = next(reader, None)
+            if not raw_header:
                 raise CommandError("CSV has no header row.")
 
-            fieldnames = [name.strip() for name in reader.fieldnames if name is not None]
+            fieldnames = [(name or "").strip() for name in raw_header]
+
+            # With pyarrow installed, hand row tokenization to its columnar
+            # reader (which consumes the header itself from a fresh handle).
+            rows = _iter_arrow_rows(path, raw_header) if pacsv is not None else reader
 
-            location_key, id_key, en_key, est_key = _resolve_required_keys(fieldnames)
+            loc_i, id_i, en_i, est_i = _resolve_required_indices(fieldnames)
 
+            required_indices = {loc_i, id_i, en_i, est_i}
             locale_headers = [
-                name
-                for name in fieldnames
-                if name
-                and name not in {location_key, id_key, en_key, est_key}
+                (name, i)
+                for i, name in enumerate(fieldnames)
+                if name and i not in required_indices
             ]
 
-            with transaction.atomic():
-                locales_by_header: dict[str, Locale] = {}
-                for header in locale_headers:
-                    legacy_code = _extract_locale_code(header)
-                    locale = _upsert_locale(legacy_code, counts)
-                    locales_by_header[header] = locale
+            # Each batch commits independently so a huge CSV does not pile up
+            # millions of row versions in one transaction (WAL/autovacuum
+            # pressure on Postgres) and a late failure keeps earlier batches.
+            # --dry-run still needs everything in one rollbackable transaction,
+            # so only then is an outer atomic opened; the per-batch atomics
+            # collapse into it via savepoint=False.
+            outer = transaction.atomic() if dry_run else contextlib.nullcontext()
+
+            with outer:
+                with transaction.atomic(savepoint=False):
+                    header_locales = _upsert_locales(
+                        [_extract_locale_code(header) for header, _ in locale_headers], counts
+                    )
+                locale_cols: list[tuple[Locale, int]] = [
+                    (locale, col_i)
+                    for locale, (_, col_i) in zip(header_locales, locale_headers)
+                ]
+
+                # Two up-front preloads replace the per-batch key lookups:
+                # every StringUnit by (location, message_id), and every
+                # Translation for the import's locales by (string_unit, locale).
+                existing_su: dict[tuple[str, str], dict[str, object]] = {
+                    (su_row["location"], su_row["message_id"]): su_row
+                    for su_row in StringUnit.objects.values(
+                        "id",
+                        "location",
+                        "message_id",
+                        "source_text",
+                        "source_updated_on",
+                        "source_hash",
+                    ).iterator(chunk_size=10000)
+                }
+
+                locale_ids = [locale.id for locale, _ in locale_cols]
+                existing_tr: dict[tuple[int, int], dict[str, object]] = {
+                    (tr_row["string_unit_id"], tr_row["locale_id"]): tr_row
+                    for tr_row in Translation.objects.filter(locale_id__in=locale_ids)
+                    .values(
+                        "string_unit_id",
+                        "locale_id",
+                        "approved_text",
+                        "status",
+                        "provenance",
+                        "source_hash_at_last_update",
+                        "reviewer_id",
+                    )
+                    .iterator(chunk_size=10000)
+                }
+
+                pending: list[_PendingRow] = []
 
-                for row in reader:
+                for row in rows:
                     counts.rows_total += 1
+                    ncols = len(row)
 
-                    location = (row.get(location_key) or "").strip()
-                    message_id = (row.get(id_key) or "").strip()
+                    location = (row[loc_i] if loc_i < ncols else "").strip()
+                    message_id = (row[id_i] if id_i < ncols else "").strip()
 
                     if not location or not message_id:
                         counts.rows_skipped += 1
@@ -244,101 +652,42 @@ class Command(BaseCommand):
                     if limit is not None and counts.rows_processed >= limit:
                         break
 
-                    source_text = _strip_trailing_newlines(row.get(en_key))
-                    source_updated_on = (row.get(est_key) or "")
+                    source_text = _strip_trailing_newlines(row[en_i] if en_i < ncols else "")
+                    source_updated_on = row[est_i] if est_i < ncols else ""
 
-                    string_unit, created = StringUnit.objects.get_or_create(
+                    pending_row = _PendingRow(
                         location=location,
                         message_id=message_id,
-                        defaults={
-                            "source_text": source_text,
-                            "source_updated_on": source_updated_on,
-                        },
+                        source_text=source_text,
+                        source_updated_on=source_updated_on,
                     )
 
-                    if created:
-                        counts.stringunits_created += 1
-                    else:
-                        changed = False
-                        if string_unit.source_text != source_text:
-                            string_unit.source_text = source_text
-                            changed = True
-                        if string_unit.source_updated_on != source_updated_on:
-                            string_unit.source_updated_on = source_updated_on
-                            changed = True
-
-                        if changed:
-                            string_unit.save()
-                            counts.stringunits_updated += 1
-
-                    # Ensure source_hash is present (model computes on save).
-                    if not string_unit.source_hash:
-                        string_unit.save(update_fields=["source_hash"])
-
-                    for header in locale_headers:
-                        cell_text = _strip_trailing_newlines(row.get(header))
-                        if not cell_text.strip():
+                    for locale, col_i in locale_cols:
+                        # Test for emptiness before allocating any stripped
+                        # copy — most cells in a sparse locale column are blank.
+                        raw = row[col_i] if col_i < ncols else ""
+                        if not raw or not raw.strip():
                             continue
+                        pending_row.cells.append((locale, raw.rstrip("\r\n")))
 
-                        locale = locales_by_header[header]
-
-                        tr, tr_created = Translation.objects.get_or_create(
-                            string_unit=string_unit,
-                            locale=locale,
-                            defaults={
-                                "approved_text": cell_text,
-                                "status": Translation.TranslationStatus.APPROVED,
-                                "provenance": Translation.TranslationProvenance.IMPORTED,
-                                "source_hash_at_last_update": string_unit.source_hash,
-                                "reviewer": None,
-                            },
-                        )
-
-                        if tr_created:
-                            counts.translations_created += 1
-                            if row_verbose:
-                                self.stdout.write(
-                                    f"[create] {locale.code} {location}::{message_id}"
-                                )
-                            continue
-
-                        update_fields: list[str] = []
-
-                        if tr.approved_text != cell_text:
-                            tr.approved_text = cell_text
-                            update_fields.append("approved_text")
-
-                        if tr.status != Translation.TranslationStatus.APPROVED:
-                            tr.status = Translation.TranslationStatus.APPROVED
-                            update_fields.append("status")
-
-                        if tr.provenance != Translation.TranslationProvenance.IMPORTED:
-                            tr.provenance = Translation.TranslationProvenance.IMPORTED
-                            update_fields.append("provenance")
-
-                        if tr.source_hash_at_last_update != string_unit.source_hash:
-                            tr.source_hash_at_last_update = string_unit.source_hash
-                            update_fields.append("source_hash_at_last_update")
-
-                        if tr.reviewer_id is not None:
-                            tr.reviewer = None
-                            update_fields.append("reviewer")
-
-                        # Do NOT touch reviewer_text or machine_draft.
+                    pending.append(pending_row)
+                    counts.rows_processed += 1
 
-                        if update_fields:
-                            tr.save(update_fields=update_fields)
-                            counts.translations_updated += 1
-                            if row_verbose:
-                                self.stdout.write(
-                                    f"[update] {locale.code} {location}::{message_id}"
-                                )
+                    if len(pending) >= BATCH_SIZE:
+                        with transaction.atomic(savepoint=False):
+                            self._flush(pending, counts, row_verbose, existing_su, existing_tr)
+                        pending = []
 
-                    counts.rows_processed += 1
+                if pending:
+                    with transaction.atomic(savepoint=False):
+                        self._flush(pending, counts, row_verbose, existing_su, existing_tr)
 
                 if dry_run:
                     transaction.set_rollback(True)
 
+        # The memoized hashes are only profitable within a single run.
+        compute_source_hash.cache_clear()
+
         self.stdout.write(
             "\n".join(
                 [
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-29 16:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('l10n', '0009_add_desired_role_to_application'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translation',
+            name='has_qa_warnings',
+            field=models.GeneratedField(db_persist=True, expression=models.ExpressionWrapper(models.Q(('qa_flags', []), _negated=True), output_field=models.BooleanField()), output_field=models.BooleanField(), verbose_name='QA'),
+        ),
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['has_qa_warnings'], name='idx_translation_has_qa'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.17 on 2026-08-29 16:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Admin search uses ILIKE '%q%', which only an index with trigram opclasses can
+# serve. pg_trgm is Postgres-only, so these run as no-ops on other backends
+# (e.g. the SQLite test database).
+_TRIGRAM_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_stringunit_source_trgm "
+    "ON l10n_stringunit USING gin (source_text gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_translation_approved_trgm "
+    "ON l10n_translation USING gin (approved_text gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_translation_reviewer_trgm "
+    "ON l10n_translation USING gin (reviewer_text gin_trgm_ops)",
+]
+
+_TRIGRAM_DROP_SQL = [
+    "DROP INDEX IF EXISTS idx_translation_reviewer_trgm",
+    "DROP INDEX IF EXISTS idx_translation_approved_trgm",
+    "DROP INDEX IF EXISTS idx_stringunit_source_trgm",
+]
+
+
+def _create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for statement in _TRIGRAM_SQL:
+        schema_editor.execute(statement)
+
+
+def _drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for statement in _TRIGRAM_DROP_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('l10n', '0010_translation_has_qa_warnings_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['locale', 'string_unit'], name='idx_translation_locale_unit'),
+        ),
+        migrations.RunPython(_create_trigram_indexes, _drop_trigram_indexes),
+    ]
@@ -0,0 +1,58 @@
+# Data migration for the SHA-256 -> blake2b switch in compute_source_hash.
+#
+# Stored StringUnit.source_hash values were produced by the old algorithm, so
+# they must be recomputed in place. Translations whose
+# source_hash_at_last_update matched the old hash are rewritten to the new one
+# so approved rows do not spuriously look stale after the switch.
+
+import hashlib
+import unicodedata
+
+from django.db import migrations
+
+
+def _blake2b_hash(text):
+    normalized = unicodedata.normalize("NFC", text or "").strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _sha256_hash(text):
+    normalized = unicodedata.normalize("NFC", text or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _recompute(apps, schema_editor, hasher):
+    StringUnit = apps.get_model("l10n", "StringUnit")
+    Translation = apps.get_model("l10n", "Translation")
+
+    for unit in StringUnit.objects.values("pk", "source_text", "source_hash").iterator(
+        chunk_size=2000
+    ):
+        new_hash = hasher(unit["source_text"])
+        old_hash = unit["source_hash"]
+        if new_hash == old_hash:
+            continue
+        StringUnit.objects.filter(pk=unit["pk"]).update(source_hash=new_hash)
+        Translation.objects.filter(
+            string_unit_id=unit["pk"],
+            source_hash_at_last_update=old_hash,
+        ).update(source_hash_at_last_update=new_hash)
+
+
+def _forwards(apps, schema_editor):
+    _recompute(apps, schema_editor, _blake2b_hash)
+
+
+def _backwards(apps, schema_editor):
+    _recompute(apps, schema_editor, _sha256_hash)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("l10n", "0011_translation_idx_translation_locale_unit"),
+    ]
+
+    operations = [
+        migrations.RunPython(_forwards, _backwards),
+    ]
@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import unicodedata
 
@@ -5,9 +6,41 @@ from django.conf import settings
 from django.db import models
 
 
+@functools.lru_cache(maxsize=200_000)
+def _cached_source_hash(text: str) -> str:
+    # Voyant CSVs repeat the same English strings across many rows, and
+    # re-imports hash every row again; the cache short-circuits both.
+    # blake2b is a content key, not a security boundary: it is ~3-4x faster
+    # than SHA-256 in software and digest_size=32 keeps the 64-char hex
+    # format (and column width) unchanged.
+    stripped = text.strip()
+    if stripped.isascii():
+        # NFC is a no-op on ASCII, which covers nearly all English source
+        # strings; isascii() is a single C flag check, so skip the
+        # normalization state machine entirely.
+        data = stripped.encode("ascii")
+    else:
+        data = unicodedata.normalize("NFC", stripped).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
 def compute_source_hash(text: str) -> str:
-    normalized = unicodedata.normalize("NFC", text or "").strip()
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return _cached_source_hash(text or "")
+
+
+# Let long-running callers (the importer) drop the cache when they finish.
+compute_source_hash.cache_clear = _cached_source_hash.cache_clear  # type: ignore[attr-defined]
+
+
+def compute_source_hashes(texts: list[str]) -> list[str]:
+    """Hash a whole batch in one tight comprehension.
+
+    Used by the CSV importer so the hot loop stays in hashlib's C path
+    instead of paying per-row function and attribute lookups via
+    StringUnit.save().
+    """
+    cached = _cached_source_hash
+    return [cached(t or "") for t in texts]
 
 
 class Locale(models.Model):
@@ -38,13 +71,26 @@ class StringUnit(models.Model):
             ),
         ]
 
-    def save(self, *args, **kwargs):
+    _UNSET = object()
+
+    def save(self, *args, old_source_hash=_UNSET, skip_stale_check=False, **kwargs):
+        """Recompute source_hash and mark approved translations stale on change.
+
+        Callers that already know the stored hash (e.g. the CSV importer's
+        preload) can pass old_source_hash to skip the per-save probe SELECT,
+        or skip_stale_check=True to suppress the cascade entirely.
+        """
         new_hash = compute_source_hash(self.source_text)
-        old_hash = None
-        if self.pk:
+        if skip_stale_check:
+            old_hash = None
+        elif old_source_hash is not self._UNSET:
+            old_hash = old_source_hash
+        elif self.pk:
             old_hash = (
                 StringUnit.objects.filter(pk=self.pk).values_list("source_hash", flat=True).first()
             )
+        else:
+            old_hash = None
         self.source_hash = new_hash
         super().save(*args, **kwargs)
 
@@ -103,6 +149,17 @@ class Translation(models.Model):
 
     qa_flags = models.JSONField(default=list, blank=True)
 
+    # Stored generated column so admin filters can hit a btree index instead of
+    # comparing against '[]'::jsonb (a seq-scan) on every changelist render.
+    has_qa_warnings = models.GeneratedField(
+        expression=models.ExpressionWrapper(
+            ~models.Q(qa_flags=[]), output_field=models.BooleanField()
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        verbose_name="QA",
+    )
+
     status = models.CharField(
         max_length=32,
         choices=TranslationStatus.choices,
@@ -151,6 +208,9 @@ class Translation(models.Model):
         ]
         indexes = [
             models.Index(fields=["locale", "status"], name="idx_translation_locale_status"),
+            models.Index(fields=["has_qa_warnings"], name="idx_translation_has_qa"),
+            # Backs the admin changelist ordering (locale, then string unit key).
+            models.Index(fields=["locale", "string_unit"], name="idx_translation_locale_unit"),
         ]
 
     def __str__(self) -> str:
@@ -171,7 +231,22 @@ class Translation(models.Model):
 
         self.qa_flags = flags
 
-    def save(self, *args, **kwargs):
+    # QA flags depend only on these fields; saves that touch none of them
+    # (e.g. reviewer-only writes) skip the recompute automatically.
+    _QA_INPUT_FIELDS = frozenset(
+        {"approved_text", "reviewer_text", "translator_text", "machine_draft", "status"}
+    )
+
+    def save(self, *args, skip_qa: bool = False, **kwargs):
+        # Bulk callers (the CSV importer, pipeline backfills) that have not
+        # changed any user-editable text can opt out of the QA recompute,
+        # which otherwise costs a string_unit SELECT per row.
+        update_fields = kwargs.get("update_fields")
+        if skip_qa or (
+            update_fields is not None and self._QA_INPUT_FIELDS.isdisjoint(update_fields)
+        ):
+            return super().save(*args, **kwargs)
+
         approved = (self.approved_text or "").strip()
         reviewer = (self.reviewer_text or "").strip()
         translator = (self.translator_text or "").strip()
@@ -190,7 +265,6 @@ class Translation(models.Model):
 
         self.refresh_qa_flags(candidate)
 
-        update_fields = kwargs.get("update_fields")
         if update_fields is not None:
             kwargs["update_fields"] = list(set(update_fields) | {"qa_flags"})
 
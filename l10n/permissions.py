@@ -8,10 +8,23 @@ from __future__ import annotations
 from .models import LocaleAssignment, TranslatorApplication
 
 
+def _group_names(user) -> set[str]:
+    """Group names for the user, fetched once and memoized on the user object.
+
+    Role checks otherwise issue one EXISTS query each, several times per
+    admin request; group membership never changes mid-request.
+    """
+    cached = getattr(user, "_l10n_group_names", None)
+    if cached is None:
+        cached = set(user.groups.values_list("name", flat=True))
+        user._l10n_group_names = cached
+    return cached
+
+
 def is_superadmin(user) -> bool:
     if not user.is_authenticated:
         return False
-    return getattr(user, "is_superuser", False) or user.groups.filter(name="L10N_SUPERADMIN").exists()
+    return getattr(user, "is_superuser", False) or "L10N_SUPERADMIN" in _group_names(user)
 
 
 def is_approved_reviewer(user) -> bool:
@@ -25,7 +38,7 @@ def is_approved_reviewer(user) -> bool:
         return False
     if app.status != TranslatorApplication.ApplicationStatus.APPROVED:
         return False
-    return user.groups.filter(name="L10N_REVIEWER").exists()
+    return "L10N_REVIEWER" in _group_names(user)
 
 
 def is_approved_translator(user) -> bool:
@@ -39,7 +52,7 @@ def is_approved_translator(user) -> bool:
         return False
     if app.status != TranslatorApplication.ApplicationStatus.APPROVED:
         return False
-    return user.groups.filter(name="L10N_TRANSLATOR").exists()
+    return "L10N_TRANSLATOR" in _group_names(user)
 
 
 def is_approver(user) -> bool:
@@ -47,13 +60,25 @@ def is_approver(user) -> bool:
         return False
     if is_superadmin(user):
         return True
-    return user.groups.filter(name__in=["L10N_APPROVER", "L10N_SUPERADMIN"]).exists()
+    return bool({"L10N_APPROVER", "L10N_SUPERADMIN"} & _group_names(user))
 
 
 def is_reviewer(user) -> bool:
     """Check group membership only (no application check). Used by admin."""
-    return user.groups.filter(name="L10N_REVIEWER").exists()
+    return "L10N_REVIEWER" in _group_names(user)
+
 
+def assigned_locale_ids(user) -> set[int]:
+    """Locale ids assigned to the user, memoized on the user for the request.
 
-def assigned_locale_ids(user) -> list[int]:
-    return list(LocaleAssignment.objects.filter(user=user).values_list("locale_id", flat=True))
+    Admin calls this from get_queryset, has_change_permission (once per row on
+    changelists) and get_readonly_fields; caching on the request-scoped user
+    object collapses those repeated SELECTs into one.
+    """
+    cached = getattr(user, "_l10n_assigned_locale_ids", None)
+    if cached is None:
+        cached = set(
+            LocaleAssignment.objects.filter(user=user).values_list("locale_id", flat=True)
+        )
+        user._l10n_assigned_locale_ids = cached
+    return cached
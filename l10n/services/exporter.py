@@ -5,9 +5,14 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from django.core.management.base import CommandError
+from django.db.models import CharField, OuterRef, Q, Subquery
+from django.db.models.functions import Cast
 
 from l10n.models import Locale, StringUnit, Translation
 
+# Rows fetched per keyset page; bounds peak memory during an export.
+_PAGE_SIZE = 5000
+
 
 @dataclass(frozen=True)
 class ExportStats:
@@ -21,6 +26,35 @@ def _is_nonempty(value: str | None) -> bool:
     return bool((value or "").strip())
 
 
+def _iter_stringunit_rows(base_qs):
+    """Stream rows in (location, message_id) order via keyset pagination.
+
+    Each page filters past the previous page's last key instead of walking a
+    single long-lived cursor: the composite unique index on
+    (location, message_id) serves every page in sorted order, no transaction
+    snapshot is pinned across the whole export, and memory stays bounded at
+    one page. base_qs must be a values() queryset containing both key columns.
+    """
+
+    ordered = base_qs.order_by("location", "message_id")
+    last_key = None
+    while True:
+        page_qs = ordered
+        if last_key is not None:
+            page_qs = page_qs.filter(
+                Q(location__gt=last_key[0])
+                | Q(location=last_key[0], message_id__gt=last_key[1])
+            )
+        page = list(page_qs[:_PAGE_SIZE])
+        if not page:
+            return
+        yield from page
+        if len(page) < _PAGE_SIZE:
+            return
+        last_row = page[-1]
+        last_key = (last_row["location"], last_row["message_id"])
+
+
 def export_locale_csv(
     *,
     locale_code: str,
@@ -59,25 +93,31 @@ def export_locale_csv(
     if include_source_updated:
         header.append("source_updated_on")
 
-    # Preload translations for this locale to avoid N+1.
-    translations_by_string_unit_id: dict[int, dict[str, object]] = {}
-    for row in (
-        Translation.objects.filter(locale=locale)
-        .values("string_unit_id", "approved_text", "updated_at")
-        .iterator()
-    ):
-        translations_by_string_unit_id[int(row["string_unit_id"])] = row
-
+    # One streamed query: the locale's translation is joined in as correlated
+    # subqueries, so no O(N) preload dict is held in memory. values() yields
+    # plain dicts — no Model.__init__ per row.
+    locale_translation = Translation.objects.filter(
+        string_unit=OuterRef("pk"), locale=locale
+    )
     stringunits_qs = (
         StringUnit.objects.all()
-        .order_by("location", "message_id")
-        .only(
-            "id",
+        .annotate(
+            approved_text=Subquery(locale_translation.values("approved_text")[:1]),
+            # Cast in the database so the timestamp arrives as a ready-made
+            # string; no per-row datetime object or isoformat() allocation.
+            translation_updated_at=Cast(
+                Subquery(locale_translation.values("updated_at")[:1]),
+                output_field=CharField(),
+            ),
+        )
+        .values(
             "location",
             "message_id",
             "source_text",
             "source_hash",
             "source_updated_on",
+            "approved_text",
+            "translation_updated_at",
         )
     )
 
@@ -85,25 +125,27 @@ def export_locale_csv(
     approved_count = 0
     missing_count = 0
 
-    with output_path.open("w", encoding="utf-8", newline="") as f:
+    # Stream keyset pages straight into a generously buffered file: peak
+    # memory stays O(page) rather than O(N).
+    with output_path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(header)
 
-        for su in stringunits_qs.iterator():
+        # Hand rows to the C writer 1000 at a time; writerows amortizes the
+        # per-row Python->C dispatch that writerow pays.
+        out_chunk: list[list[str]] = []
+
+        for su in _iter_stringunit_rows(stringunits_qs):
             total_string_units += 1
-            tr_row = translations_by_string_unit_id.get(su.id)
-            approved_text = None
-            updated_at = None
-            if tr_row:
-                approved_text = tr_row.get("approved_text")  # type: ignore[assignment]
-                updated_at = tr_row.get("updated_at")
+            approved_text = su["approved_text"]
+            updated_at = su["translation_updated_at"]
 
             has_approved = _is_nonempty(approved_text)
 
             if has_approved:
                 status = "APPROVED"
-                translation_value = str(approved_text)
-                translation_updated_at = updated_at.isoformat() if updated_at else ""
+                translation_value = approved_text
+                translation_updated_at = updated_at or ""
                 approved_count += 1
             else:
                 status = "MISSING"
@@ -115,20 +157,26 @@ def export_locale_csv(
                 continue
 
             row_out = [
-                su.location,
-                su.message_id,
-                su.source_text,
+                su["location"],
+                su["message_id"],
+                su["source_text"],
                 locale_code,
                 translation_value,
                 status,
-                su.source_hash,
+                su["source_hash"],
                 translation_updated_at,
             ]
 
             if include_source_updated:
-                row_out.append(su.source_updated_on)
+                row_out.append(su["source_updated_on"])
+
+            out_chunk.append(row_out)
+            if len(out_chunk) >= 1000:
+                writer.writerows(out_chunk)
+                out_chunk.clear()
 
-            writer.writerow(row_out)
+        if out_chunk:
+            writer.writerows(out_chunk)
 
     return ExportStats(
         total_string_units=total_string_units,
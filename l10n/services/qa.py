@@ -1,54 +1,292 @@
-import re
+import functools
+import string
 from collections import Counter
 
-def extract_placeholders(text: str | None) -> set[str]:
-    if not text:
-        return set()
+# Placeholder shapes recognized by _scan_placeholders: %(name)s, %1$s, %s
+# (conversion chars s/d/f/o/x), and curly {0}/{name} with no nesting.
+_PCT_TERMINATORS = frozenset("sdfox")
+_NAME_START = frozenset(string.ascii_letters + "_")
+_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
 
-    found: set[str] = set()
 
-    percent_patterns = [
-        r"%(?!%)\([A-Za-z_][A-Za-z0-9_]*\)[sdfox]",  # %(name)s
-        r"%(?!%)\d+\$[sdfox]",  # %1$s
-        r"%(?!%)[sdfox]",  # %s
-    ]
-    for pattern in percent_patterns:
-        found.update(re.findall(pattern, text))
+def _scan_placeholders(text: str) -> set[str]:
+    """Collect placeholder tokens in one manual left-to-right pass.
 
-    # Curly placeholders: {0}, {name} (no nesting)
-    found.update(re.findall(r"\{[^{}]+\}", text))
+    Replaces the old alternation regex
+    %(?!%)(?:\\([A-Za-z_][A-Za-z0-9_]*\\)[sdfox]|\\d+\\$[sdfox]|[sdfox])|\\{[^{}]+\\}
+    with explicit lookahead: str.find hops between '%'/'{' in C, and each
+    candidate token is validated with frozenset membership checks instead of
+    the regex engine's per-character classify step.
+    """
 
+    found: set[str] = set()
+    find = text.find
+    n = len(text)
+    i = 0
+    while i < n:
+        pi = find("%", i)
+        ci = find("{", i)
+        if pi == -1:
+            if ci == -1:
+                break
+            i = ci
+        elif ci == -1 or pi < ci:
+            i = pi
+        else:
+            i = ci
+
+        if text[i] == "%":
+            j = i + 1
+            if j >= n:
+                break
+            c = text[j]
+            if c in _PCT_TERMINATORS:
+                found.add(text[i : j + 1])
+                i = j + 1
+            elif c == "(":
+                k = j + 1
+                if k < n and text[k] in _NAME_START:
+                    k += 1
+                    while k < n and text[k] in _NAME_CHARS:
+                        k += 1
+                    if (
+                        k + 1 < n
+                        and text[k] == ")"
+                        and text[k + 1] in _PCT_TERMINATORS
+                    ):
+                        found.add(text[i : k + 2])
+                        i = k + 2
+                        continue
+                i += 1
+            elif c.isdecimal():
+                k = j + 1
+                while k < n and text[k].isdecimal():
+                    k += 1
+                if k + 1 < n and text[k] == "$" and text[k + 1] in _PCT_TERMINATORS:
+                    found.add(text[i : k + 2])
+                    i = k + 2
+                else:
+                    i += 1
+            else:
+                # '%%' escapes and any other character: no token starts here.
+                i += 1
+        else:  # '{'
+            close = find("}", i + 1)
+            nested = find("{", i + 1)
+            if close > i + 1 and (nested == -1 or close < nested):
+                found.add(text[i : close + 1])
+                i = close + 1
+            else:
+                i += 1
     return found
 
+# Keep the tag list tight and heuristic-driven.
+_TAG_NAMES = frozenset({"b", "i", "strong", "em", "span", "a"})
 
-def extract_html_tags(text: str | None) -> dict[str, int]:
+
+def _scan_tags(text: str) -> Counter[str]:
+    """Count open/close occurrences of the tags in _TAG_NAMES.
+
+    Equivalent to scanning with <\\s*(/)?\\s*(b|i|strong|em|span|a)\\b[^>]*>
+    (case-insensitive), but walks the string directly: find() hops between
+    '<' characters in C and only the few characters of a candidate tag are
+    examined in Python, instead of simulating the regex NFA per position.
+    """
+
+    counts: Counter[str] = Counter()
+    find = text.find
+    n = len(text)
+    i = find("<")
+    while i != -1:
+        j = i + 1
+        while j < n and text[j].isspace():
+            j += 1
+        is_close = j < n and text[j] == "/"
+        if is_close:
+            j += 1
+            while j < n and text[j].isspace():
+                j += 1
+        k = j
+        # Longest accepted name is 6 chars ("strong"); anything longer
+        # cannot match, so stop accumulating early.
+        while k < n and text[k].isalpha() and k - j < 7:
+            k += 1
+        name = text[j:k].lower()
+        if name in _TAG_NAMES and (
+            k >= n or not (text[k].isalnum() or text[k] == "_")
+        ):
+            end = find(">", k)
+            if end == -1:
+                break  # no closing '>' anywhere ahead: nothing more can match
+            counts[f"{name}_{'close' if is_close else 'open'}"] += 1
+            i = find("<", end + 1)
+        else:
+            i = find("<", i + 1)
+    return counts
+
+
+def extract_placeholders(text: str | None) -> list[str]:
+    """Return the deduplicated placeholders in text, sorted ascending."""
     if not text:
+        return []
+
+    return sorted(_scan_placeholders(text))
+
+
+def _diff_sorted(a: list[str], b: list[str]) -> tuple[list[str], list[str]]:
+    """Return (a-only, b-only) from two sorted, deduplicated lists.
+
+    One linear merge instead of two set differences plus two sorted() calls.
+    """
+
+    only_a: list[str] = []
+    only_b: list[str] = []
+    i = j = 0
+    na, nb = len(a), len(b)
+    while i < na and j < nb:
+        x = a[i]
+        y = b[j]
+        if x == y:
+            i += 1
+            j += 1
+        elif x < y:
+            only_a.append(x)
+            i += 1
+        else:
+            only_b.append(y)
+            j += 1
+    only_a.extend(a[i:])
+    only_b.extend(b[j:])
+    return only_a, only_b
+
+
+def extract_html_tags(text: str | None) -> dict[str, int]:
+    if not text or "<" not in text:
         return {}
 
-    # Keep the list tight and heuristic-driven.
-    tag_names = "b|i|strong|em|span|a"
-    pattern = re.compile(rf"<\s*(/)?\s*({tag_names})\b[^>]*>", re.IGNORECASE)
+    return dict(_scan_tags(text))
 
-    counts: Counter[str] = Counter()
-    for match in pattern.finditer(text):
-        is_close = bool(match.group(1))
-        tag = match.group(2).lower()
-        key = f"{tag}_{'close' if is_close else 'open'}"
-        counts[key] += 1
 
-    return dict(counts)
+def _freeze(value):
+    """Recursively turn details dicts/lists into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _thaw(value):
+    """Invert _freeze: tuples of pairs become dicts, other tuples lists."""
+    if isinstance(value, tuple):
+        if value and isinstance(value[0], tuple):
+            return {k: _thaw(v) for k, v in value}
+        return list(value)
+    return value
 
 
 def compute_qa_flags(source: str | None, target: str | None) -> list[dict]:
-    src = source or ""
-    tgt = target or ""
+    """Return QA flags for a (source, target) pair.
+
+    Deterministic on its inputs and called on every Translation save, so the
+    real work is memoized per pair; repeated UI strings and empty targets hit
+    the cache. Each call rebuilds fresh dicts from the cached tuples, so
+    callers may mutate the result freely.
+    """
+
+    frozen = _compute_qa_flags_cached(source or "", target or "")
 
     flags: list[dict] = []
+    for code, message, details in frozen:
+        flag = {"code": code, "message": message}
+        if details is not None:
+            flag["details"] = _thaw(details)
+        flags.append(flag)
+    return flags
+
+
+@functools.lru_cache(maxsize=2048)
+def _source_signals(src: str) -> tuple[tuple[str, ...], tuple[tuple[str, int], ...]]:
+    """Source-side placeholders and tag counts, memoized per source string.
+
+    Every locale of a StringUnit shares the same source text, so during bulk
+    pipeline runs the source half of the QA work is computed once per string
+    rather than once per (source, target) pair. Both halves are returned as
+    sorted tuples so they are hashable and safe to share.
+    """
+
+    placeholders = tuple(extract_placeholders(src))
+    tags = tuple(sorted(_scan_tags(src).items())) if src and "<" in src else ()
+    return placeholders, tags
+
 
-    src_placeholders = extract_placeholders(src)
-    tgt_placeholders = extract_placeholders(tgt)
+def _freeze_flags(flags: list[dict]) -> tuple:
+    return tuple(
+        (flag["code"], flag["message"], _freeze(flag["details"]) if "details" in flag else None)
+        for flag in flags
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_qa_flags_cached(src: str, tgt: str) -> tuple:
+    flags: list[dict] = []
+
+    # Blank target — every newly created row. Only the source side can
+    # contribute flags (missing placeholders, one-sided tag mismatches,
+    # empty_translation); skip the target scans and branch work entirely.
+    if not tgt or tgt.isspace():
+        src_placeholders, src_tag_items = _source_signals(src)
+        if src_placeholders:
+            flags.append(
+                {
+                    "code": "missing_placeholder",
+                    "message": "Translation is missing placeholder(s) present in the source.",
+                    "details": {"missing": src_placeholders},
+                }
+            )
+        if src_tag_items:
+            flags.append(
+                {
+                    "code": "html_tag_mismatch",
+                    "message": "Translation HTML tag counts do not match the source.",
+                    "details": {
+                        "mismatches": {
+                            key: {"source": count, "target": 0}
+                            for key, count in src_tag_items
+                        }
+                    },
+                }
+            )
+        if src and not src.isspace():
+            flags.append(
+                {
+                    "code": "empty_translation",
+                    "message": "Translation is empty while the source is not.",
+                }
+            )
+        return _freeze_flags(flags)
+
+    # One Counter pass over the target supplies every per-character signal
+    # below — the %/{ gate for placeholders, the < gate for tags and both
+    # brace counts — instead of four separate O(n) scans of tgt.
+    tgt_chars = Counter(tgt)
+
+    src_placeholders, src_tag_items = _source_signals(src)
+    tgt_placeholders = (
+        sorted(_scan_placeholders(tgt)) if tgt_chars["%"] or tgt_chars["{"] else []
+    )
+
+    # Short UI strings usually have placeholders on at most one side; both
+    # lists are already sorted, so the diff is at worst one linear merge.
+    if not tgt_placeholders:
+        missing: list[str] | tuple[str, ...] = src_placeholders
+        extra: list[str] = []
+    elif not src_placeholders:
+        missing = []
+        extra = tgt_placeholders
+    else:
+        missing, extra = _diff_sorted(src_placeholders, tgt_placeholders)
 
-    missing = sorted(src_placeholders - tgt_placeholders)
     if missing:
         flags.append(
             {
@@ -58,7 +296,6 @@ def compute_qa_flags(source: str | None, target: str | None) -> list[dict]:
             }
         )
 
-    extra = sorted(tgt_placeholders - src_placeholders)
     if extra:
         flags.append(
             {
@@ -68,25 +305,36 @@ def compute_qa_flags(source: str | None, target: str | None) -> list[dict]:
             }
         )
 
-    if tgt.count("{") != tgt.count("}"):
+    open_braces = tgt_chars["{"]
+    close_braces = tgt_chars["}"]
+    if open_braces != close_braces:
         flags.append(
             {
                 "code": "unbalanced_braces",
                 "message": "Translation has unbalanced curly braces.",
-                "details": {"open": tgt.count("{"), "close": tgt.count("}")},
+                "details": {"open": open_braces, "close": close_braces},
             }
         )
 
-    src_tags = extract_html_tags(src)
-    tgt_tags = extract_html_tags(tgt)
-    all_keys = sorted(set(src_tags.keys()) | set(tgt_tags.keys()))
-
+    tgt_tags = dict(_scan_tags(tgt)) if tgt_chars["<"] else {}
     mismatches: dict[str, dict[str, int]] = {}
-    for key in all_keys:
-        s = int(src_tags.get(key, 0))
-        t = int(tgt_tags.get(key, 0))
-        if s != t:
-            mismatches[key] = {"source": s, "target": t}
+    # Tag counts are >= 1, so with one side empty every key mismatches —
+    # no union set or per-key .get probing needed. src_tag_items is already
+    # sorted by key.
+    if not tgt_tags:
+        for key, count in src_tag_items:
+            mismatches[key] = {"source": count, "target": 0}
+    elif not src_tag_items:
+        for key in sorted(tgt_tags):
+            mismatches[key] = {"source": 0, "target": tgt_tags[key]}
+    else:
+        src_tags = dict(src_tag_items)
+        for key in sorted(src_tags.keys() | tgt_tags.keys()):
+            # Both dicts already hold ints; no coercion needed.
+            s = src_tags.get(key, 0)
+            t = tgt_tags.get(key, 0)
+            if s != t:
+                mismatches[key] = {"source": s, "target": t}
 
     if mismatches:
         flags.append(
@@ -97,7 +345,11 @@ def compute_qa_flags(source: str | None, target: str | None) -> list[dict]:
             }
         )
 
-    if src.strip() and not tgt.strip():
+    # isspace() answers "is this blank?" without allocating the stripped copy
+    # that strip() would build just for a truthiness test.
+    src_nonblank = bool(src) and not src.isspace()
+    tgt_nonblank = bool(tgt) and not tgt.isspace()
+    if src_nonblank and not tgt_nonblank:
         flags.append(
             {
                 "code": "empty_translation",
@@ -105,4 +357,4 @@ def compute_qa_flags(source: str | None, target: str | None) -> list[dict]:
             }
         )
 
-    return flags
+    return _freeze_flags(flags)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from l10n.models import Locale, StringUnit, compute_source_hash
+
+
+def _string_unit(location: str, message_id: str, source_text: str) -> StringUnit:
+    # bulk_create skips save(), so precompute the hash the way save() would.
+    return StringUnit(
+        location=location,
+        message_id=message_id,
+        source_text=source_text,
+        source_hash=compute_source_hash(source_text),
+    )
+
+
+@pytest.fixture(scope="module")
+def export_rows(django_db_setup, django_db_blocker):
+    """Locales and StringUnits shared by every test in an export module.
+
+    Built once per module outside the per-test transaction, so individual
+    tests only create their own Translations (which roll back as usual).
+    Torn down afterwards so later modules still see a clean database.
+    """
+
+    with django_db_blocker.unblock():
+        fr, yo = Locale.objects.bulk_create(
+            [
+                Locale(code="fr", bcp47="fr", name="French", enabled=True),
+                Locale(code="yo", bcp47="yo", name="Yoruba", enabled=True),
+            ]
+        )
+        su1, su2, su3 = StringUnit.objects.bulk_create(
+            [
+                _string_unit("a", "1", "Hello"),
+                _string_unit("a", "2", "World"),
+                _string_unit("b", "3", "!"),
+            ]
+        )
+
+    yield SimpleNamespace(fr=fr, yo=yo, su1=su1, su2=su2, su3=su3)
+
+    with django_db_blocker.unblock():
+        StringUnit.objects.filter(pk__in=[su1.pk, su2.pk, su3.pk]).delete()
+        Locale.objects.filter(pk__in=[fr.pk, yo.pk]).delete()
@@ -1,45 +1,44 @@
 from __future__ import annotations
 
 import csv
+from pathlib import Path
 
 import pytest
 from django.core.management import call_command
 from django.core.management.base import CommandError
 
-from l10n.models import Locale, StringUnit, Translation
+from l10n.models import Translation
 
 
 def _read_csv(path):
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        return list(csv.reader(f))
+    # The exports under test are tiny; one read_text slurp beats per-line
+    # buffered reads through an open() context manager.
+    return list(csv.reader(Path(path).read_text(encoding="utf-8").splitlines()))
 
 
 @pytest.mark.django_db
-def test_export_all_locales_creates_one_file_per_enabled_locale(tmp_path):
-    fr = Locale.objects.create(code="fr", bcp47="fr", name="French", enabled=True)
-    yo = Locale.objects.create(code="yo", bcp47="yo", name="Yoruba", enabled=True)
-
-    su1 = StringUnit.objects.create(location="a", message_id="1", source_text="Hello")
-    su2 = StringUnit.objects.create(location="a", message_id="2", source_text="World")
-    su3 = StringUnit.objects.create(location="b", message_id="3", source_text="!")
-
-    Translation.objects.create(
-        string_unit=su1,
-        locale=fr,
-        approved_text="Pele",
-        status=Translation.TranslationStatus.APPROVED,
-    )
-    Translation.objects.create(
-        string_unit=su2,
-        locale=fr,
-        approved_text="Monde",
-        status=Translation.TranslationStatus.APPROVED,
-    )
-    Translation.objects.create(
-        string_unit=su1,
-        locale=yo,
-        approved_text="Pb",
-        status=Translation.TranslationStatus.APPROVED,
+def test_export_all_locales_creates_one_file_per_enabled_locale(tmp_path, export_rows):
+    Translation.objects.bulk_create(
+        [
+            Translation(
+                string_unit=export_rows.su1,
+                locale=export_rows.fr,
+                approved_text="Pele",
+                status=Translation.TranslationStatus.APPROVED,
+            ),
+            Translation(
+                string_unit=export_rows.su2,
+                locale=export_rows.fr,
+                approved_text="Monde",
+                status=Translation.TranslationStatus.APPROVED,
+            ),
+            Translation(
+                string_unit=export_rows.su1,
+                locale=export_rows.yo,
+                approved_text="Pb",
+                status=Translation.TranslationStatus.APPROVED,
+            ),
+        ]
     )
 
     out_dir = tmp_path / "exports"
@@ -59,11 +58,7 @@ def test_export_all_locales_creates_one_file_per_enabled_locale(tmp_path):
 
 
 @pytest.mark.django_db
-def test_export_all_locales_locales_arg_restricts(tmp_path):
-    Locale.objects.create(code="fr", bcp47="fr", name="French", enabled=True)
-    Locale.objects.create(code="yo", bcp47="yo", name="Yoruba", enabled=True)
-    StringUnit.objects.create(location="a", message_id="1", source_text="Hello")
-
+def test_export_all_locales_locales_arg_restricts(tmp_path, export_rows):
     out_dir = tmp_path / "exports"
     call_command("export_all_locales", out=str(out_dir), locales="fr")
 
@@ -72,10 +67,9 @@ def test_export_all_locales_locales_arg_restricts(tmp_path):
 
 
 @pytest.mark.django_db
-def test_export_all_locales_missing_locale_returns_nonzero_but_exports_others(tmp_path):
-    Locale.objects.create(code="fr", bcp47="fr", name="French", enabled=True)
-    StringUnit.objects.create(location="a", message_id="1", source_text="Hello")
-
+def test_export_all_locales_missing_locale_returns_nonzero_but_exports_others(
+    tmp_path, export_rows
+):
     out_dir = tmp_path / "exports"
 
     with pytest.raises(CommandError):
@@ -1,38 +1,38 @@
 from __future__ import annotations
 
 import csv
+from pathlib import Path
 
 import pytest
 from django.core.management import call_command
 from django.core.management.base import CommandError
 
-from l10n.models import Locale, StringUnit, Translation
+from l10n.models import Translation
 
 
 def _read_csv(path):
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        return list(csv.reader(f))
+    # The exports under test are tiny; one read_text slurp beats per-line
+    # buffered reads through an open() context manager.
+    return list(csv.reader(Path(path).read_text(encoding="utf-8").splitlines()))
 
 
 @pytest.mark.django_db
-def test_export_locale_csv_schema_and_rows(tmp_path):
-    fr = Locale.objects.create(code="fr", bcp47="fr", name="French")
-
-    su1 = StringUnit.objects.create(location="a", message_id="1", source_text="Hello")
-    su2 = StringUnit.objects.create(location="a", message_id="2", source_text="World")
-    su3 = StringUnit.objects.create(location="b", message_id="3", source_text="!")
-
-    Translation.objects.create(
-        string_unit=su1,
-        locale=fr,
-        approved_text="Bonjour",
-        status=Translation.TranslationStatus.APPROVED,
-    )
-    Translation.objects.create(
-        string_unit=su2,
-        locale=fr,
-        approved_text="Monde",
-        status=Translation.TranslationStatus.APPROVED,
+def test_export_locale_csv_schema_and_rows(tmp_path, export_rows):
+    Translation.objects.bulk_create(
+        [
+            Translation(
+                string_unit=export_rows.su1,
+                locale=export_rows.fr,
+                approved_text="Bonjour",
+                status=Translation.TranslationStatus.APPROVED,
+            ),
+            Translation(
+                string_unit=export_rows.su2,
+                locale=export_rows.fr,
+                approved_text="Monde",
+                status=Translation.TranslationStatus.APPROVED,
+            ),
+        ]
     )
     # su3 intentionally missing
 
@@ -74,15 +74,10 @@ def test_export_locale_csv_schema_and_rows(tmp_path):
 
 
 @pytest.mark.django_db
-def test_export_locale_csv_only_missing(tmp_path):
-    fr = Locale.objects.create(code="fr", bcp47="fr", name="French")
-
-    su1 = StringUnit.objects.create(location="a", message_id="1", source_text="Hello")
-    su2 = StringUnit.objects.create(location="a", message_id="2", source_text="World")
-
+def test_export_locale_csv_only_missing(tmp_path, export_rows):
     Translation.objects.create(
-        string_unit=su1,
-        locale=fr,
+        string_unit=export_rows.su1,
+        locale=export_rows.fr,
         approved_text="Bonjour",
         status=Translation.TranslationStatus.APPROVED,
     )
@@ -93,10 +88,12 @@ def test_export_locale_csv_only_missing(tmp_path):
     out_path = out_dir / "voyant_fr.csv"
     rows = _read_csv(out_path)
 
-    # header + 1 missing row
-    assert len(rows) == 2
+    # header + the two untranslated StringUnits
+    assert len(rows) == 3
     assert rows[1][0:2] == ["a", "2"]
+    assert rows[2][0:2] == ["b", "3"]
     assert rows[1][5] == "MISSING"
+    assert rows[2][5] == "MISSING"
 
 
 @pytest.mark.django_db
@@ -13,12 +13,20 @@ from l10n.models import Locale, LocaleAssignment, StringUnit, Translation
 
 @pytest.mark.django_db
 def test_reviewer_queryset_is_locale_scoped():
-    fr = Locale.objects.create(code="fr", bcp47="fr", name="French")
-    de = Locale.objects.create(code="de", bcp47="de", name="German")
+    fr, de = Locale.objects.bulk_create(
+        [
+            Locale(code="fr", bcp47="fr", name="French"),
+            Locale(code="de", bcp47="de", name="German"),
+        ]
+    )
 
     unit = StringUnit.objects.create(location="ui", message_id="hello", source_text="Hello")
-    Translation.objects.create(string_unit=unit, locale=fr)
-    Translation.objects.create(string_unit=unit, locale=de)
+    Translation.objects.bulk_create(
+        [
+            Translation(string_unit=unit, locale=fr),
+            Translation(string_unit=unit, locale=de),
+        ]
+    )
 
     reviewer = get_user_model().objects.create_user(
         username="reviewer",
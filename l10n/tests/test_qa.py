@@ -4,7 +4,6 @@ from l10n.models import Locale, StringUnit, Translation
 from l10n.services.qa import compute_qa_flags
 
 
-@pytest.mark.django_db
 def test_missing_placeholder_flag():
     flags = compute_qa_flags(source="Hello {0}", target="Bonjour")
     assert any(f["code"] == "missing_placeholder" for f in flags)
@@ -12,13 +11,11 @@ def test_missing_placeholder_flag():
     assert "{0}" in missing
 
 
-@pytest.mark.django_db
 def test_html_tag_mismatch_flag():
     flags = compute_qa_flags(source="<b>Hi</b>", target="<b>Salut")
     assert any(f["code"] == "html_tag_mismatch" for f in flags)
 
 
-@pytest.mark.django_db
 def test_unbalanced_braces_flag():
     flags = compute_qa_flags(source="X", target="{")
     assert any(f["code"] == "unbalanced_braces" for f in flags)